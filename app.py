@@ -1,27 +1,84 @@
 from __future__ import annotations
 
+import contextlib
 import csv
+import functools
+import gzip
+import hashlib
+import http.client
 import io
+import itertools
 import json
+import os
+import queue
 import re
+import socket
 import sqlite3
-import subprocess
 import sys
 import threading
 import urllib.parse
 import urllib.request
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+try:
+    import orjson
+except ImportError:  # optional; the stdlib encoder below produces the same JSON
+    orjson = None
 
 DB_PATH = Path("data/pokewiki.db")
 CSV_BASE = "https://raw.githubusercontent.com/PokeAPI/pokeapi/master/data/v2/csv"
+CSV_TABLES = [
+    "languages",
+    "pokemon",
+    "pokemon_species",
+    "pokemon_species_names",
+    "pokemon_forms",
+    "pokemon_form_names",
+    "version_groups",
+    "pokemon_evolution",
+    "evolution_triggers",
+    "evolution_trigger_prose",
+    "items",
+    "item_names",
+    "pokemon_stats",
+    "stats",
+    "pokemon_abilities",
+    "abilities",
+    "ability_names",
+    "ability_prose",
+    "ability_flavor_text",
+    "pokemon_types",
+    "type_names",
+    "type_efficacy",
+    "pokemon_moves",
+    "pokemon_move_methods",
+    "moves",
+    "move_names",
+    "move_effect_prose",
+    "move_flavor_text",
+    "move_damage_classes",
+    "move_damage_class_prose",
+]
+CSV_FETCH_WORKERS = 16
+INSERT_BATCH_ROWS = 500
+# SQLITE_MAX_VARIABLE_NUMBER default before SQLite 3.32; one batched INSERT binds at most this many values
+SQLITE_MAX_VARIABLES = 999
 DEFAULT_KO_LANG_ID = "3"
 DEFAULT_EN_LANG_ID = "9"
 HOST = "0.0.0.0"
 PORT = 7860
-DB_SCHEMA_VERSION = 4
-
+ACCESS_LOG = os.environ.get("POKEWIKI_ACCESS_LOG", "") not in ("", "0")
+HTTP_THREADS = int(os.environ.get("POKEWIKI_HTTP_THREADS") or max(8, (os.cpu_count() or 1) * 4))
+DB_SCHEMA_VERSION = 10
+DB_MTIME = 0  # set by ensure_db; part of the detail ETag
+
+ARTWORK_BASE = "https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork"
+# JSON string literal of a pokemon's artwork URL, formatted straight to bytes with % pid
+ARTWORK_URL_JSON = b'"' + ARTWORK_BASE.encode("ascii") + b'/%d.png"'
 STAT_ORDER = ["hp", "attack", "defense", "special-attack", "special-defense", "speed"]
 STAT_LABELS = {
     "hp": "HP",
@@ -31,10 +88,42 @@ STAT_LABELS = {
     "special-defense": "특수방어",
     "speed": "스피드",
 }
+# [[key, label], ...] in display order; the detail query walks it with json_each to order and label the stats
+STAT_LAYOUT_JSON = json.dumps([[key, STAT_LABELS[key]] for key in STAT_ORDER], ensure_ascii=False)
+
+RE_EFFECT_LINK = re.compile(r"\[([^\]]+)\]\{[^}]+\}")
+RE_WHITESPACE = re.compile(r"\s+")
+RE_LATIN = re.compile(r"[A-Za-z]")
+STRIP_BRACKETS = str.maketrans("", "", "[]")
+
+CsvTable = tuple[dict[str, int], list[tuple[str, ...]]]
+
+# Files are UTF-8 on disk, so their bytes are served as-is without a decode/encode round trip.
+INDEX_HTML = Path("templates/index.html").read_bytes()
+STYLE_CSS = Path("static/style.css").read_bytes()
+APP_JS = Path("static/app.js").read_bytes()
+# path -> (utf-8 body, gzip body, content type, etag); compressed and hashed once at import.
+# The tag is weak because the same tag covers both encodings.
+STATIC_ASSETS = {
+    path: (raw, gzip.compress(raw, 9), ctype, f'W/"{hashlib.blake2b(raw, digest_size=8).hexdigest()}"')
+    for path, raw, ctype in (
+        ("/", INDEX_HTML, "text/html; charset=utf-8"),
+        ("/static/style.css", STYLE_CSS, "text/css; charset=utf-8"),
+        ("/static/app.js", APP_JS, "application/javascript; charset=utf-8"),
+    )
+}
+# URLs are not versioned, so responses get a day of caching rather than "immutable".
+CACHE_CONTROL = "public, max-age=86400"
+
 
-INDEX_HTML = Path("templates/index.html").read_text(encoding="utf-8")
-STYLE_CSS = Path("static/style.css").read_text(encoding="utf-8")
-APP_JS = Path("static/app.js").read_text(encoding="utf-8")
+def dumps_json(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+ERROR_INVALID_ID = dumps_json({"error": "invalid id"})
+ERROR_NOT_FOUND = dumps_json({"error": "not found"})
 
 
 def safe_int(v: str | None, default: int = 0) -> int:
@@ -44,96 +133,127 @@ def safe_int(v: str | None, default: int = 0) -> int:
         return default
 
 
-def resolve_language_ids(languages: list[dict[str, str]]) -> tuple[str, str]:
-    ko = next((r["id"] for r in languages if r.get("identifier") == "ko"), DEFAULT_KO_LANG_ID)
-    en = next((r["id"] for r in languages if r.get("identifier") == "en"), DEFAULT_EN_LANG_ID)
-    return ko, en
+def int_or(v: str, default: int = 0) -> int:
+    # For numeric CSV columns that may be blank; no exception handling on the hot path.
+    return int(v) if v else default
 
 
-def latest_localized_text(rows: list[dict[str, str]], id_key: str, text_key: str, lang_id: str, order_key: str) -> dict[str, str]:
-    out: dict[str, tuple[int, str]] = {}
-    for r in rows:
-        if r.get("local_language_id") != lang_id:
-            continue
-        text = (r.get(text_key) or "").replace("\n", " ").strip()
-        if not text:
-            continue
-        oid = safe_int(r.get(order_key), 0)
-        key = r[id_key]
-        prev = out.get(key)
-        if prev is None or oid >= prev[0]:
-            out[key] = (oid, text)
-    return {k: v[1] for k, v in out.items()}
+def resolve_language_ids(languages: CsvTable) -> tuple[str, str]:
+    i_id, i_ident = column_indexes(languages, "id", "identifier")
+    ko = next((r[i_id] for r in languages[1] if r[i_ident] == "ko"), DEFAULT_KO_LANG_ID)
+    en = next((r[i_id] for r in languages[1] if r[i_ident] == "en"), DEFAULT_EN_LANG_ID)
+    return ko, en
 
 
+def language_column(table: CsvTable) -> int | None:
+    # The *_flavor_text CSVs name this column language_id, so nothing matches for them (same as before).
+    return table[0].get("local_language_id")
+
+
+def effect_prose_by_language(table: CsvTable, id_key: str, *lang_ids: str) -> list[dict[str, str]]:
+    # One pass over the table fills the short_effect-or-effect map of every requested language.
+    outs: list[dict[str, str]] = [{} for _ in lang_ids]
+    i_lang = language_column(table)
+    if i_lang is None:
+        return outs
+    by_lang = dict(zip(lang_ids, outs))
+    i_key, i_short, i_effect = column_indexes(table, id_key, "short_effect", "effect")
+    for r in table[1]:
+        out = by_lang.get(r[i_lang])
+        if out is not None:
+            out[r[i_key]] = r[i_short] or r[i_effect]
+    return outs
+
+
+def latest_localized_text(table: CsvTable, id_key: str, text_key: str, order_key: str, *lang_ids: str) -> list[dict[str, str]]:
+    # One pass keeps, per requested language, the text from the highest order_key for each id.
+    latest: list[dict[str, tuple[int, str]]] = [{} for _ in lang_ids]
+    i_lang = language_column(table)
+    if i_lang is not None:
+        by_lang = dict(zip(lang_ids, latest))
+        i_key, i_text, i_order = column_indexes(table, id_key, text_key, order_key)
+        for r in table[1]:
+            out = by_lang.get(r[i_lang])
+            if out is None:
+                continue
+            text = r[i_text].replace("\n", " ").strip()
+            if not text:
+                continue
+            oid = safe_int(r[i_order], 0)
+            key = r[i_key]
+            prev = out.get(key)
+            if prev is None or oid >= prev[0]:
+                out[key] = (oid, text)
+    return [{k: v[1] for k, v in out.items()} for out in latest]
 
 
 def clean_effect_text(text: str) -> str:
     t = text.replace("\n", " ").strip()
-    t = re.sub(r"\[([^\]]+)\]\{[^}]+\}", r"\1", t)
-    t = t.replace("[", "").replace("]", "")
-    t = re.sub(r"\s+", " ", t)
+    t = RE_EFFECT_LINK.sub(r"\1", t)
+    t = t.translate(STRIP_BRACKETS)
+    t = RE_WHITESPACE.sub(" ", t)
     return t.strip()
 
 
-def translate_en_to_ko(text: str) -> str:
-    t = clean_effect_text(text)
-    low = t.lower()
-
-    # Common full-sentence patterns first (avoid mixed ko/en output)
-    m = re.search(r"(\d+)% chance to make the target flinch\.?", low)
-    if m:
-        return f"{m.group(1)}% 확률로 상대를 풀죽게 한다."
-
-    if "inflicts regular damage with no additional effect" in low:
-        return "추가 효과 없이 일반적인 데미지를 준다."
-
-    if "causes one-hit ko" in low:
-        return "일격에 상대를 쓰러뜨릴 수 있다."
-
-    if "confuses the target" in low:
-        return "상대를 혼란 상태로 만든다."
+STAT_NAMES_KO = {
+    "special defense": "특수방어",
+    "special attack": "특수공격",
+    "attack": "공격",
+    "defense": "방어",
+    "speed": "스피드",
+    "accuracy": "명중",
+    "evasion": "회피",
+}
+STAGE_COUNTS = {"one": "1", "two": "2", "three": "3", "four": "4", "five": "5", "six": "6"}
 
-    if "heals the user by half its max hp" in low:
-        return "사용자의 최대 HP 절반만큼 회복한다."
 
-    if "equal to the user's level" in low or "equal to the user’s level" in low:
-        return "사용자의 레벨과 같은 데미지를 준다."
+def translate_stage_change(m: re.Match[str], low: str) -> str:
+    stat = m.group("stat").strip()
+    stat = STAT_NAMES_KO.get(stat, stat)
+    stage = STAGE_COUNTS.get(m.group("n"), m.group("n"))
+    if m.group("dir").startswith("lowers"):
+        return f"상대의 {stat}(을/를) {stage}랭크 떨어뜨린다."
+    return f"사용자의 {stat}(을/를) {stage}랭크 올린다."
 
-    if "protecting the user from further damage or status changes until it breaks" in low and "1/4" in low:
-        return "사용자의 최대 HP의 1/4을 소비해 분신인 인형을 만들고, 인형이 사라질 때까지 데미지와 상태이상을 막는다."
 
+# (pattern, handler) in priority order. A handler returns None when an extra condition fails.
+TRANSLATION_RULES: list[tuple[str, Callable[[re.Match[str], str], str | None]]] = [
+    # Common full-sentence patterns first (avoid mixed ko/en output)
+    (r"(?P<chance>\d+)% chance to make the target flinch\.?", lambda m, low: f"{m.group('chance')}% 확률로 상대를 풀죽게 한다."),
+    ("inflicts regular damage with no additional effect", lambda m, low: "추가 효과 없이 일반적인 데미지를 준다."),
+    ("causes one-hit ko", lambda m, low: "일격에 상대를 쓰러뜨릴 수 있다."),
+    ("confuses the target", lambda m, low: "상대를 혼란 상태로 만든다."),
+    ("heals the user by half its max hp", lambda m, low: "사용자의 최대 HP 절반만큼 회복한다."),
+    ("equal to the user['’]s level", lambda m, low: "사용자의 레벨과 같은 데미지를 준다."),
+    (
+        "protecting the user from further damage or status changes until it breaks",
+        lambda m, low: "사용자의 최대 HP의 1/4을 소비해 분신인 인형을 만들고, 인형이 사라질 때까지 데미지와 상태이상을 막는다." if "1/4" in low else None,
+    ),
     # stage up/down patterns
-    stat_map = {
-        "special defense": "특수방어",
-        "special attack": "특수공격",
-        "attack": "공격",
-        "defense": "방어",
-        "speed": "스피드",
-        "accuracy": "명중",
-        "evasion": "회피",
-    }
-    stage_map = {"one": "1", "two": "2", "three": "3", "four": "4", "five": "5", "six": "6"}
+    (
+        r"(?P<dir>lowers the target'?s?|raises the user'?s?) (?P<stat>[a-z ]+) by (?P<n>one|two|three|four|five|six) stages?",
+        translate_stage_change,
+    ),
+    # Status immunity / weather snippets
+    ("prevents paralysis", lambda m, low: "마비 상태가 되지 않는다."),
+    ("protects against sandstorm damage", lambda m, low: "모래바람 데미지를 받지 않는다."),
+    ("increases evasion", lambda m, low: "모래바람일 때 회피율이 상승한다." if "sandstorm" in low else None),
+]
+RE_TRANSLATION = re.compile("|".join(f"(?P<rule{i}>{pattern})" for i, (pattern, _) in enumerate(TRANSLATION_RULES)), re.IGNORECASE)
 
-    m = re.search(r"lowers the target'?s? ([a-z ]+) by (one|two|three|four|five|six) stages?", low)
-    if m:
-        stat = stat_map.get(m.group(1).strip(), m.group(1).strip())
-        stage = stage_map.get(m.group(2), m.group(2))
-        return f"상대의 {stat}(을/를) {stage}랭크 떨어뜨린다."
 
-    m = re.search(r"raises the user'?s? ([a-z ]+) by (one|two|three|four|five|six) stages?", low)
-    if m:
-        stat = stat_map.get(m.group(1).strip(), m.group(1).strip())
-        stage = stage_map.get(m.group(2), m.group(2))
-        return f"사용자의 {stat}(을/를) {stage}랭크 올린다."
+def translate_en_to_ko(text: str) -> str:
+    t = clean_effect_text(text)
+    low = t.lower()
 
-    # Status immunity / weather snippets
-    if "prevents paralysis" in low:
-        return "마비 상태가 되지 않는다."
-    if "protects against sandstorm damage" in low:
-        return "모래바람 데미지를 받지 않는다."
-    if "increases evasion" in low and "sandstorm" in low:
-        return "모래바람일 때 회피율이 상승한다."
+    # One scan collects every rule hit; the earliest rule in TRANSLATION_RULES still wins.
+    hits: dict[int, re.Match[str]] = {}
+    for m in RE_TRANSLATION.finditer(low):
+        hits.setdefault(int(m.lastgroup.removeprefix("rule")), m)
+    for rule in sorted(hits):
+        translated = TRANSLATION_RULES[rule][1](hits[rule], low)
+        if translated:
+            return translated
 
     # Generic fallback: keep UI fully Korean
     return "공식 한글 설명이 없습니다."
@@ -146,45 +266,100 @@ def choose_localized_text(ko_primary: str | None, ko_secondary: str | None, en_p
     for cand in [en_primary, en_secondary]:
         if cand and cand.strip():
             translated = translate_en_to_ko(cand)
-            if re.search(r"[A-Za-z]", translated):
+            if RE_LATIN.search(translated):
                 return "공식 한글 설명이 없습니다."
             return translated
     return "공식 한글 설명이 없습니다."
 
-def fetch_csv(name: str) -> list[dict[str, str]]:
+# Each fetch worker keeps one HTTPS connection open, so the TLS handshake is paid once per worker, not per file.
+FETCH_STATE = threading.local()
+
+
+def csv_connection(fresh: bool = False) -> http.client.HTTPSConnection:
+    con = getattr(FETCH_STATE, "con", None)
+    if con is None or fresh:
+        if con is not None:
+            con.close()
+        con = FETCH_STATE.con = http.client.HTTPSConnection(urllib.parse.urlsplit(CSV_BASE).netloc, timeout=120)
+    return con
+
+
+def csv_uses_proxy() -> bool:
+    # HTTPS_PROXY / the Windows proxy settings; urlopen already handles proxies (and their auth), so those go through it
+    return "https" in urllib.request.getproxies() and not urllib.request.proxy_bypass(urllib.parse.urlsplit(CSV_BASE).hostname)
+
+
+def read_csv_table(res: io.BufferedIOBase) -> CsvTable:
+    # rows are parsed as the body streams in (decoded in buffered chunks, not line by line)
+    text = io.TextIOWrapper(res, encoding="utf-8", newline="")
+    reader = csv.reader(text)
+    header = next(reader)
+    rows = list(map(tuple, filter(None, reader)))
+    text.detach()
+    # read1() does not mark the response finished at EOF; until it is, the connection refuses the next request
+    res.read()
+    res.close()
+    return {col: i for i, col in enumerate(header)}, rows
+
+
+def fetch_csv(name: str) -> CsvTable:
     url = f"{CSV_BASE}/{name}.csv"
-    with urllib.request.urlopen(url, timeout=120) as res:
-        raw = res.read().decode("utf-8")
-    return list(csv.DictReader(io.StringIO(raw)))
+    if csv_uses_proxy():
+        with urllib.request.urlopen(url, timeout=120) as res:
+            return read_csv_table(res)
+    path = urllib.parse.urlsplit(url).path
+    try:
+        con = csv_connection()
+        con.request("GET", path)
+        res = con.getresponse()
+    except ConnectionError:
+        # the server may have dropped an idle keep-alive connection; retry once on a new one
+        con = csv_connection(fresh=True)
+        con.request("GET", path)
+        res = con.getresponse()
+    if 300 <= res.status < 400:
+        # redirects are rare here; let urlopen follow them rather than reimplementing it
+        res.read()
+        with urllib.request.urlopen(url, timeout=120) as res:
+            return read_csv_table(res)
+    if res.status != 200:
+        res.read()
+        raise OSError(f"{name}.csv: HTTP {res.status} {res.reason}")
+    return read_csv_table(res)
+
+
+def fetch_all(names: list[str]) -> dict[str, CsvTable]:
+    # downloads are latency-bound, so all files are in flight at once over the workers' keep-alive connections
+    with ThreadPoolExecutor(max_workers=min(CSV_FETCH_WORKERS, len(names))) as ex:
+        return dict(zip(names, ex.map(fetch_csv, names)))
+
+
+def insert_batched(cur: sqlite3.Cursor, table: str, width: int, rows: Iterable[tuple]) -> None:
+    # one multi-row INSERT per batch, so statement dispatch is paid per batch instead of per row
+    batch_rows = max(1, min(INSERT_BATCH_ROWS, SQLITE_MAX_VARIABLES // width))
+    row_sql = "(" + ",".join("?" * width) + ")"
+    batch_sql = f"INSERT INTO {table} VALUES " + ",".join([row_sql] * batch_rows)
+    it = iter(rows)
+    while batch := list(itertools.islice(it, batch_rows)):
+        sql = batch_sql if len(batch) == batch_rows else f"INSERT INTO {table} VALUES " + ",".join([row_sql] * len(batch))
+        cur.execute(sql, list(itertools.chain.from_iterable(batch)))
+
+
+def column_indexes(table: CsvTable, *names: str) -> tuple[int, ...]:
+    cols = table[0]
+    return tuple(cols[name] for name in names)
 
 
 def ensure_db() -> None:
+    global DB_MTIME
     if DB_PATH.exists():
         try:
+            # user_version is written in the same transaction as the data, so it alone marks a complete, current build
             con = sqlite3.connect(DB_PATH)
-            count = con.execute("SELECT COUNT(*) FROM pokemon").fetchone()[0]
             user_version = con.execute("PRAGMA user_version").fetchone()[0]
-            pokemon_cols = {r[1] for r in con.execute("PRAGMA table_info(pokemon)").fetchall()}
-            form_cols = {r[1] for r in con.execute("PRAGMA table_info(pokemon_form_meta)").fetchall()}
-            ability_cols = {r[1] for r in con.execute("PRAGMA table_info(pokemon_ability)").fetchall()}
-            level_cols = {r[1] for r in con.execute("PRAGMA table_info(pokemon_level_move)").fetchall()}
-            evo_cols = {r[1] for r in con.execute("PRAGMA table_info(evolution_member)").fetchall()}
-            edge_cols = {r[1] for r in con.execute("PRAGMA table_info(evolution_edge)").fetchall()}
             con.close()
-            has_new_schema = {
-                "display_name_ko",
-                "species_id",
-                "evolution_chain_id",
-                "is_post_oras",
-            }.issubset(pokemon_cols) and {"is_mega", "is_gmax", "introduced_generation"}.issubset(form_cols) and {
-                "ability_effect_ko",
-                "is_post_oras",
-            }.issubset(ability_cols) and {"learn_level", "is_post_oras"}.issubset(level_cols) and {
-                "chain_id",
-                "pokemon_id",
-                "depth",
-            }.issubset(evo_cols) and {"from_pokemon_id", "to_pokemon_id", "condition_text"}.issubset(edge_cols)
-            if count > 0 and has_new_schema and user_version == DB_SCHEMA_VERSION:
+            if user_version == DB_SCHEMA_VERSION:
+                DB_MTIME = DB_PATH.stat().st_mtime_ns
                 return
         except Exception:
             pass
@@ -197,14 +372,22 @@ def ensure_db() -> None:
         if DB_PATH.exists():
             DB_PATH.unlink()
         raise RuntimeError("데이터셋 초기화 실패: 네트워크에서 PokeAPI CSV를 내려받을 수 없습니다.") from exc
+    DB_MTIME = DB_PATH.stat().st_mtime_ns
 
 
 def build_database(path: Path) -> None:
-    con = sqlite3.connect(path)
+    con = sqlite3.connect(path, isolation_level=None)
     cur = con.cursor()
+    # Whole build runs in one write transaction; a failed build is deleted by ensure_db, so skip fsyncs.
     cur.executescript(
         """
         PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=OFF;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA cache_size=-200000;
+        PRAGMA locking_mode=EXCLUSIVE;
+        PRAGMA wal_autocheckpoint=0;
+        BEGIN IMMEDIATE;
 
         CREATE TABLE pokemon (
             id INTEGER PRIMARY KEY,
@@ -215,8 +398,6 @@ def build_database(path: Path) -> None:
             evolution_chain_id INTEGER,
             is_post_oras INTEGER NOT NULL
         );
-        CREATE INDEX idx_pokemon_korean_name ON pokemon(korean_name);
-        CREATE INDEX idx_pokemon_display_name ON pokemon(display_name_ko);
 
         CREATE TABLE pokemon_form_meta (
             pokemon_id INTEGER PRIMARY KEY,
@@ -287,67 +468,61 @@ def build_database(path: Path) -> None:
         """
     )
 
-    languages = fetch_csv("languages")
+    csvs = fetch_all(CSV_TABLES)
+
+    languages = csvs["languages"]
     ko_lang_id, en_lang_id = resolve_language_ids(languages)
 
-    pokemon = fetch_csv("pokemon")
-    species = fetch_csv("pokemon_species")
-    species_names = fetch_csv("pokemon_species_names")
-    pokemon_forms = fetch_csv("pokemon_forms")
-    form_names = fetch_csv("pokemon_form_names")
-    version_groups = fetch_csv("version_groups")
-    pokemon_evolution = fetch_csv("pokemon_evolution")
-    evolution_triggers = fetch_csv("evolution_triggers")
-    evolution_trigger_prose = fetch_csv("evolution_trigger_prose")
-    items = fetch_csv("items")
-    item_names = fetch_csv("item_names")
-
-    pokemon_stats = fetch_csv("pokemon_stats")
-    stats = fetch_csv("stats")
-
-    pokemon_abilities = fetch_csv("pokemon_abilities")
-    abilities = fetch_csv("abilities")
-    ability_names = fetch_csv("ability_names")
-    ability_prose = fetch_csv("ability_prose")
-    ability_flavor_text = fetch_csv("ability_flavor_text")
-
-    pokemon_types = fetch_csv("pokemon_types")
-    type_names = fetch_csv("type_names")
-    type_efficacy = fetch_csv("type_efficacy")
-
-    pokemon_moves = fetch_csv("pokemon_moves")
-    move_methods = fetch_csv("pokemon_move_methods")
-    moves = fetch_csv("moves")
-    move_names = fetch_csv("move_names")
-    move_effect_prose = fetch_csv("move_effect_prose")
-    move_flavor_text = fetch_csv("move_flavor_text")
-    damage_classes = fetch_csv("move_damage_classes")
-    damage_class_names = fetch_csv("move_damage_class_prose")
-
-    species_to_ko = {r["pokemon_species_id"]: r["name"] for r in species_names if r["local_language_id"] == ko_lang_id}
-    species_id_to_identifier = {r["id"]: r["identifier"] for r in species}
-    species_generation = {r["id"]: safe_int(r.get("generation_id"), 0) for r in species}
-    species_chain = {r["id"]: safe_int(r.get("evolution_chain_id"), 0) for r in species}
-    species_parent = {r["id"]: (r["evolves_from_species_id"] or "") for r in species}
-
-    pokemon_to_species = {r["id"]: r["species_id"] for r in pokemon}
-    pokemon_order = {r["id"]: safe_int(r.get("order"), 99999) for r in pokemon}
-
-    version_group_to_gen = {r["id"]: safe_int(r.get("generation_id"), 0) for r in version_groups}
-    forms_by_pokemon = {r["pokemon_id"]: r for r in pokemon_forms}
-    form_name_ko = {
-        r["pokemon_form_id"]: (r.get("pokemon_name") or r.get("form_name") or "").strip()
-        for r in form_names
-        if r["local_language_id"] == ko_lang_id
-    }
+    i_sid, i_lang, i_name = column_indexes(csvs["pokemon_species_names"], "pokemon_species_id", "local_language_id", "name")
+    species_to_ko = {r[i_sid]: r[i_name] for r in csvs["pokemon_species_names"][1] if r[i_lang] == ko_lang_id}
+    species = csvs["pokemon_species"][1]
+    i_id, i_ident, i_gen, i_chain, i_parent = column_indexes(
+        csvs["pokemon_species"], "id", "identifier", "generation_id", "evolution_chain_id", "evolves_from_species_id"
+    )
+    species_id_to_identifier: dict[str, str] = {}
+    species_generation: dict[str, int] = {}
+    species_chain: dict[str, int] = {}
+    species_parent: dict[str, str] = {}
+    chain_species: dict[int, list[str]] = defaultdict(list)
+    for r in species:
+        sid_text = r[i_id]
+        species_id_to_identifier[sid_text] = r[i_ident]
+        species_generation[sid_text] = int_or(r[i_gen])
+        cid = int_or(r[i_chain])
+        species_chain[sid_text] = cid
+        species_parent[sid_text] = r[i_parent]
+        if cid > 0:
+            chain_species[cid].append(sid_text)
+
+    pokemon = csvs["pokemon"][1]
+    i_id, i_ident, i_sid, i_order = column_indexes(csvs["pokemon"], "id", "identifier", "species_id", "order")
+    pokemon_to_species = {r[i_id]: r[i_sid] for r in pokemon}
+    pokemon_order = {r[i_id]: safe_int(r[i_order], 99999) for r in pokemon}
+
+    i_vg_id, i_vg_gen = column_indexes(csvs["version_groups"], "id", "generation_id")
+    version_group_to_gen = {r[i_vg_id]: safe_int(r[i_vg_gen], 0) for r in csvs["version_groups"][1]}
+    i_form_pid, i_form_id, i_form_vg, i_form_default, i_form_mega, i_form_order, i_form_ident = column_indexes(
+        csvs["pokemon_forms"],
+        "pokemon_id",
+        "id",
+        "introduced_in_version_group_id",
+        "is_default",
+        "is_mega",
+        "form_order",
+        "form_identifier",
+    )
+    forms_by_pokemon = {r[i_form_pid]: r for r in csvs["pokemon_forms"][1]}
+    i_fid, i_lang, i_pname, i_fname = column_indexes(csvs["pokemon_form_names"], "pokemon_form_id", "local_language_id", "pokemon_name", "form_name")
+    form_name_ko = {r[i_fid]: (r[i_pname] or r[i_fname]).strip() for r in csvs["pokemon_form_names"][1] if r[i_lang] == ko_lang_id}
 
     pokemon_rows: list[tuple[int, str, str, str, int, int, int]] = []
     form_meta_rows: list[tuple[int, int, int, int, int, int, int]] = []
     for p in pokemon:
-        pid = int(p["id"])
+        pid = int(p[i_id])
         pid_key = str(pid)
+        identifier = p[i_ident]
         sid = pokemon_to_species[pid_key]
-        base_name = species_to_ko.get(sid, species_id_to_identifier.get(sid, p["identifier"]))
+        base_name = species_to_ko.get(sid, species_id_to_identifier.get(sid, identifier))
         form = forms_by_pokemon.get(pid_key)
 
         introduced_gen = species_generation.get(sid, 0)
@@ -357,194 +532,222 @@ def build_database(path: Path) -> None:
         form_order = 9999
 
         if form:
-            vg = form.get("introduced_in_version_group_id")
+            vg = form[i_form_vg]
             if vg:
                 introduced_gen = version_group_to_gen.get(vg, introduced_gen)
-            is_default = safe_int(form.get("is_default"), 0)
-            is_mega = safe_int(form.get("is_mega"), 0)
-            form_order = safe_int(form.get("form_order"), 9999)
-            form_identifier = (form.get("form_identifier") or "")
-            is_gmax = 1 if "gmax" in p["identifier"] or "gmax" in form_identifier else 0
+            is_default = safe_int(form[i_form_default], 0)
+            is_mega = safe_int(form[i_form_mega], 0)
+            form_order = safe_int(form[i_form_order], 9999)
+            is_gmax = 1 if "gmax" in identifier or "gmax" in form[i_form_ident] else 0
 
         is_post_oras = 1 if introduced_gen > 6 else 0
         display_name = base_name
-        if form and form_name_ko.get(form["id"]):
-            display_name = form_name_ko[form["id"]]
-        elif p["identifier"] != species_id_to_identifier.get(sid, p["identifier"]):
-            display_name = f"{base_name} ({p['identifier']})"
+        if form and form_name_ko.get(form[i_form_id]):
+            display_name = form_name_ko[form[i_form_id]]
+        elif identifier != species_id_to_identifier.get(sid, identifier):
+            display_name = f"{base_name} ({identifier})"
 
         chain_id = species_chain.get(sid, 0)
-        pokemon_rows.append((pid, p["identifier"], base_name, display_name, int(sid), chain_id, is_post_oras))
+        pokemon_rows.append((pid, identifier, base_name, display_name, int(sid), chain_id, is_post_oras))
         form_meta_rows.append((pid, is_default, is_mega, is_gmax, introduced_gen, form_order, pokemon_order[pid_key]))
 
     cur.executemany("INSERT INTO pokemon VALUES(?,?,?,?,?,?,?)", pokemon_rows)
     cur.executemany("INSERT INTO pokemon_form_meta VALUES(?,?,?,?,?,?,?)", form_meta_rows)
 
-    stat_id_to_identifier = {r["id"]: r["identifier"] for r in stats}
+    # stat ids are small and dense, so a list indexed by the parsed id replaces the string-keyed dict
+    i_id, i_ident = column_indexes(csvs["stats"], "id", "identifier")
+    stat_identifiers: list[str | None] = [None] * (max((int(r[i_id]) for r in csvs["stats"][1]), default=0) + 1)
+    for r in csvs["stats"][1]:
+        stat_identifiers[int(r[i_id])] = r[i_ident]
+    i_pid, i_stat, i_base = column_indexes(csvs["pokemon_stats"], "pokemon_id", "stat_id", "base_stat")
     cur.executemany(
         "INSERT INTO pokemon_stat VALUES(?,?,?)",
-        [(safe_int(r["pokemon_id"]), stat_id_to_identifier[r["stat_id"]], safe_int(r["base_stat"])) for r in pokemon_stats],
+        ((int(r[i_pid]), stat_identifiers[int(r[i_stat])], int(r[i_base])) for r in csvs["pokemon_stats"][1]),
     )
 
-    ability_name_ko = {r["ability_id"]: r["name"] for r in ability_names if r["local_language_id"] == ko_lang_id}
-    ability_effect_ko = {r["ability_id"]: (r["short_effect"] or r["effect"]) for r in ability_prose if r["local_language_id"] == ko_lang_id}
-    ability_effect_en = {r["ability_id"]: (r["short_effect"] or r["effect"]) for r in ability_prose if r["local_language_id"] == en_lang_id}
-    ability_flavor_ko = latest_localized_text(ability_flavor_text, "ability_id", "flavor_text", ko_lang_id, "version_group_id")
-    ability_flavor_en = latest_localized_text(ability_flavor_text, "ability_id", "flavor_text", en_lang_id, "version_group_id")
-    ability_identifier = {r["id"]: r["identifier"] for r in abilities}
-    ability_generation = {r["id"]: safe_int(r.get("generation_id"), 0) for r in abilities}
-
-    ability_rows = []
-    for r in pokemon_abilities:
-        aid = r["ability_id"]
-        ability_rows.append(
+    i_aid, i_lang, i_name = column_indexes(csvs["ability_names"], "ability_id", "local_language_id", "name")
+    ability_name_ko = {r[i_aid]: r[i_name] for r in csvs["ability_names"][1] if r[i_lang] == ko_lang_id}
+    ability_effect_ko, ability_effect_en = effect_prose_by_language(csvs["ability_prose"], "ability_id", ko_lang_id, en_lang_id)
+    ability_flavor_ko, ability_flavor_en = latest_localized_text(csvs["ability_flavor_text"], "ability_id", "flavor_text", "version_group_id", ko_lang_id, en_lang_id)
+    i_id, i_ident, i_gen = column_indexes(csvs["abilities"], "id", "identifier", "generation_id")
+    ability_identifier = {r[i_id]: r[i_ident] for r in csvs["abilities"][1]}
+    ability_generation = {r[i_id]: safe_int(r[i_gen], 0) for r in csvs["abilities"][1]}
+
+    i_pid, i_aid, i_hidden = column_indexes(csvs["pokemon_abilities"], "pokemon_id", "ability_id", "is_hidden")
+    cur.executemany(
+        "INSERT INTO pokemon_ability VALUES(?,?,?,?,?,?)",
+        (
             (
-                safe_int(r["pokemon_id"]),
-                safe_int(aid),
+                int(r[i_pid]),
+                int(aid),
                 ability_name_ko.get(aid, ability_identifier.get(aid, "unknown")),
                 choose_localized_text(ability_flavor_ko.get(aid), ability_effect_ko.get(aid), ability_flavor_en.get(aid), ability_effect_en.get(aid)),
                 1 if ability_generation.get(aid, 0) > 6 else 0,
-                safe_int(r.get("is_hidden"), 0),
+                int_or(r[i_hidden]),
             )
-        )
-    cur.executemany("INSERT INTO pokemon_ability VALUES(?,?,?,?,?,?)", ability_rows)
+            for r in csvs["pokemon_abilities"][1]
+            for aid in (r[i_aid],)
+        ),
+    )
 
-    type_name_ko = {r["type_id"]: r["name"] for r in type_names if r["local_language_id"] == ko_lang_id}
+    i_tid, i_lang, i_name = column_indexes(csvs["type_names"], "type_id", "local_language_id", "name")
+    type_name_ko = {r[i_tid]: r[i_name] for r in csvs["type_names"][1] if r[i_lang] == ko_lang_id}
+    i_pid, i_tid, i_slot = column_indexes(csvs["pokemon_types"], "pokemon_id", "type_id", "slot")
     cur.executemany(
         "INSERT INTO pokemon_type VALUES(?,?,?,?)",
-        [(safe_int(r["pokemon_id"]), safe_int(r["type_id"]), safe_int(r["slot"]), type_name_ko.get(r["type_id"], r["type_id"])) for r in pokemon_types],
+        ((int(r[i_pid]), int(r[i_tid]), int(r[i_slot]), type_name_ko.get(r[i_tid], r[i_tid])) for r in csvs["pokemon_types"][1]),
     )
 
+    i_atk, i_target, i_factor = column_indexes(csvs["type_efficacy"], "damage_type_id", "target_type_id", "damage_factor")
     cur.executemany(
         "INSERT INTO type_efficacy VALUES(?,?,?)",
-        [(safe_int(r["damage_type_id"]), safe_int(r["target_type_id"]), safe_int(r["damage_factor"])) for r in type_efficacy],
+        ((int(r[i_atk]), int(r[i_target]), int(r[i_factor])) for r in csvs["type_efficacy"][1]),
     )
 
-    egg_method_ids = {r["id"] for r in move_methods if r["identifier"] == "egg"}
-    level_method_ids = {r["id"] for r in move_methods if r["identifier"] == "level-up"}
-
-    move_name_ko = {r["move_id"]: r["name"] for r in move_names if r["local_language_id"] == ko_lang_id}
-    move_identifier = {r["id"]: r["identifier"] for r in moves}
-    move_detail = {r["id"]: r for r in moves}
-    move_effect_ko = {r["move_effect_id"]: (r["short_effect"] or r["effect"]) for r in move_effect_prose if r["local_language_id"] == ko_lang_id}
-    move_effect_en = {r["move_effect_id"]: (r["short_effect"] or r["effect"]) for r in move_effect_prose if r["local_language_id"] == en_lang_id}
-    move_flavor_ko = latest_localized_text(move_flavor_text, "move_id", "flavor_text", ko_lang_id, "version_group_id")
-    move_flavor_en = latest_localized_text(move_flavor_text, "move_id", "flavor_text", en_lang_id, "version_group_id")
-    damage_class_identifier = {r["id"]: r["identifier"] for r in damage_classes}
-    damage_class_ko = {r["move_damage_class_id"]: r["name"] for r in damage_class_names if r["local_language_id"] == ko_lang_id}
-
-    seen_egg: set[tuple[int, str]] = set()
-    egg_rows = []
-    seen_level: set[tuple[int, str, int]] = set()
-    level_rows = []
-
-    for r in pokemon_moves:
-        m = move_detail.get(r["move_id"])
-        if not m:
-            continue
-
-        effect_text = choose_localized_text(move_flavor_ko.get(r["move_id"]), move_effect_ko.get(m["effect_id"]), move_flavor_en.get(r["move_id"]), move_effect_en.get(m["effect_id"])).replace("$effect_chance", m["effect_chance"] or "-")
-        dmg_cls = damage_class_ko.get(m["damage_class_id"], damage_class_identifier.get(m["damage_class_id"], "미상"))
-        is_post_oras = 1 if safe_int(m.get("generation_id"), 0) > 6 else 0
-
-        if r["pokemon_move_method_id"] in egg_method_ids:
-            key = (safe_int(r["pokemon_id"]), r["move_id"])
-            if key not in seen_egg:
-                seen_egg.add(key)
-                egg_rows.append(
-                    (
-                        safe_int(r["pokemon_id"]),
-                        move_name_ko.get(r["move_id"], move_identifier.get(r["move_id"], "unknown")),
-                        move_identifier.get(r["move_id"], "unknown"),
-                        type_name_ko.get(m["type_id"], m["type_id"]),
-                        dmg_cls,
-                        safe_int(m.get("power"), 0),
-                        safe_int(m.get("accuracy"), 0),
-                        safe_int(m.get("pp"), 0),
-                        effect_text,
-                        is_post_oras,
-                    )
-                )
-
-        if r["pokemon_move_method_id"] in level_method_ids:
-            lvl = safe_int(r.get("level"), 0)
-            key = (safe_int(r["pokemon_id"]), r["move_id"], lvl)
-            if key not in seen_level:
-                seen_level.add(key)
-                level_rows.append(
-                    (
-                        safe_int(r["pokemon_id"]),
-                        move_name_ko.get(r["move_id"], move_identifier.get(r["move_id"], "unknown")),
-                        type_name_ko.get(m["type_id"], m["type_id"]),
-                        dmg_cls,
-                        safe_int(m.get("power"), 0),
-                        safe_int(m.get("accuracy"), 0),
-                        safe_int(m.get("pp"), 0),
-                        effect_text,
-                        lvl,
-                        is_post_oras,
-                    )
-                )
-
-    cur.executemany("INSERT INTO pokemon_egg_move VALUES(?,?,?,?,?,?,?,?,?,?)", egg_rows)
-    cur.executemany("INSERT INTO pokemon_level_move VALUES(?,?,?,?,?,?,?,?,?,?)", level_rows)
+    i_id, i_ident = column_indexes(csvs["pokemon_move_methods"], "id", "identifier")
+    egg_method_ids = {r[i_id] for r in csvs["pokemon_move_methods"][1] if r[i_ident] == "egg"}
+    level_method_ids = {r[i_id] for r in csvs["pokemon_move_methods"][1] if r[i_ident] == "level-up"}
+
+    i_mid, i_lang, i_name = column_indexes(csvs["move_names"], "move_id", "local_language_id", "name")
+    move_name_ko = {r[i_mid]: r[i_name] for r in csvs["move_names"][1] if r[i_lang] == ko_lang_id}
+    i_id, i_ident = column_indexes(csvs["moves"], "id", "identifier")
+    move_identifier = {r[i_id]: r[i_ident] for r in csvs["moves"][1]}
+    move_detail = {r[i_id]: r for r in csvs["moves"][1]}
+    move_effect_ko, move_effect_en = effect_prose_by_language(csvs["move_effect_prose"], "move_effect_id", ko_lang_id, en_lang_id)
+    move_flavor_ko, move_flavor_en = latest_localized_text(csvs["move_flavor_text"], "move_id", "flavor_text", "version_group_id", ko_lang_id, en_lang_id)
+    i_id, i_ident = column_indexes(csvs["move_damage_classes"], "id", "identifier")
+    damage_class_identifier = {r[i_id]: r[i_ident] for r in csvs["move_damage_classes"][1]}
+    i_dcid, i_lang, i_name = column_indexes(csvs["move_damage_class_prose"], "move_damage_class_id", "local_language_id", "name")
+    damage_class_ko = {r[i_dcid]: r[i_name] for r in csvs["move_damage_class_prose"][1] if r[i_lang] == ko_lang_id}
+
+    i_m_type, i_m_power, i_m_accuracy, i_m_pp, i_m_dmg, i_m_effect, i_m_chance, i_m_gen = column_indexes(
+        csvs["moves"], "type_id", "power", "accuracy", "pp", "damage_class_id", "effect_id", "effect_chance", "generation_id"
+    )
+    i_pid, i_mid, i_method, i_level = column_indexes(csvs["pokemon_moves"], "pokemon_id", "move_id", "pokemon_move_method_id", "level")
+
+    # everything a learnset row shows about a move depends only on the move, so it is computed once per move:
+    # (name, identifier, type, damage class, power, accuracy, pp, effect text, is_post_oras)
+    move_info: dict[str, tuple[str, str, str, str, int, int, int, str, int]] = {}
+    for mid, m in move_detail.items():
+        effect_text = choose_localized_text(move_flavor_ko.get(mid), move_effect_ko.get(m[i_m_effect]), move_flavor_en.get(mid), move_effect_en.get(m[i_m_effect]))
+        if "$effect_chance" in effect_text:
+            effect_text = effect_text.replace("$effect_chance", m[i_m_chance] or "-")
+        move_info[mid] = (
+            move_name_ko.get(mid, move_identifier.get(mid, "unknown")),
+            move_identifier.get(mid, "unknown"),
+            type_name_ko.get(m[i_m_type], m[i_m_type]),
+            damage_class_ko.get(m[i_m_dmg], damage_class_identifier.get(m[i_m_dmg], "미상")),
+            int_or(m[i_m_power]),
+            int_or(m[i_m_accuracy]),
+            int_or(m[i_m_pp]),
+            effect_text,
+            1 if int_or(m[i_m_gen]) > 6 else 0,
+        )
 
-    # evolution tree members + edges
-    chain_species: dict[int, list[str]] = defaultdict(list)
-    for sp in species:
-        cid = safe_int(sp.get("evolution_chain_id"), 0)
-        if cid > 0:
-            chain_species[cid].append(sp["id"])
+    # rows are streamed straight into executemany instead of being collected in lists first
+    def egg_move_rows():
+        seen: set[tuple[int, str]] = set()
+        for r in csvs["pokemon_moves"][1]:
+            if r[i_method] not in egg_method_ids:
+                continue
+            mid = r[i_mid]
+            info = move_info.get(mid)
+            if info is None:
+                continue
+            pid = int(r[i_pid])
+            key = (pid, mid)
+            if key in seen:
+                continue
+            seen.add(key)
+            yield (pid, *info)
 
-    trigger_id_to_name = {r["id"]: r["identifier"] for r in evolution_triggers}
-    trigger_id_to_ko = {
-        r["evolution_trigger_id"]: (r.get("name") or r.get("evolution_trigger_id"))
-        for r in evolution_trigger_prose
-        if r.get("local_language_id") == ko_lang_id
-    }
-    item_id_to_name = {r["id"]: r["identifier"] for r in items}
+    def level_move_rows():
+        seen: set[tuple[int, str, int]] = set()
+        for r in csvs["pokemon_moves"][1]:
+            if r[i_method] not in level_method_ids:
+                continue
+            mid = r[i_mid]
+            info = move_info.get(mid)
+            if info is None:
+                continue
+            pid = int(r[i_pid])
+            lvl = int_or(r[i_level])
+            key = (pid, mid, lvl)
+            if key in seen:
+                continue
+            seen.add(key)
+            name, _, type_name, dmg_cls, power, accuracy, pp, effect_text, is_post_oras = info
+            yield (pid, name, type_name, dmg_cls, power, accuracy, pp, effect_text, lvl, is_post_oras)
+
+    insert_batched(cur, "pokemon_egg_move", 10, egg_move_rows())
+    insert_batched(cur, "pokemon_level_move", 10, level_move_rows())
+
+    # evolution tree members + edges
+    i_id, i_ident = column_indexes(csvs["evolution_triggers"], "id", "identifier")
+    trigger_id_to_name = {r[i_id]: r[i_ident] for r in csvs["evolution_triggers"][1]}
+    i_tid, i_lang, i_name = column_indexes(csvs["evolution_trigger_prose"], "evolution_trigger_id", "local_language_id", "name")
+    trigger_id_to_ko = {r[i_tid]: (r[i_name] or r[i_tid]) for r in csvs["evolution_trigger_prose"][1] if r[i_lang] == ko_lang_id}
+    i_id, i_ident = column_indexes(csvs["items"], "id", "identifier")
+    item_id_to_name = {r[i_id]: r[i_ident] for r in csvs["items"][1]}
+    i_iid, i_lang, i_name = column_indexes(csvs["item_names"], "item_id", "local_language_id", "name")
     item_id_to_ko = {
-        r["item_id"]: r.get("name") or item_id_to_name.get(r["item_id"], r["item_id"])
-        for r in item_names
-        if r.get("local_language_id") == ko_lang_id
+        r[i_iid]: r[i_name] or item_id_to_name.get(r[i_iid], r[i_iid])
+        for r in csvs["item_names"][1]
+        if r[i_lang] == ko_lang_id
     }
-    evo_by_species = {r["evolved_species_id"]: r for r in pokemon_evolution}
-
-    species_depth_cache: dict[tuple[str, int], int] = {}
-
-    def species_depth(species_id: str, chain_id: int) -> int:
-        key = (species_id, chain_id)
-        if key in species_depth_cache:
-            return species_depth_cache[key]
-        parent = species_parent.get(species_id, "")
-        if not parent or safe_int(species_chain.get(parent, 0), 0) != chain_id:
-            species_depth_cache[key] = 0
-            return 0
-        d = species_depth(parent, chain_id) + 1
-        species_depth_cache[key] = d
-        return d
-
-    pokemon_rows_by_species: dict[int, list[sqlite3.Row]] = defaultdict(list)
+    i_evolved, i_min_level, i_item, i_held_item, i_trigger, i_move_type, i_move, i_location, i_happiness, i_time = column_indexes(
+        csvs["pokemon_evolution"],
+        "evolved_species_id",
+        "minimum_level",
+        "trigger_item_id",
+        "held_item_id",
+        "evolution_trigger_id",
+        "known_move_type_id",
+        "known_move_id",
+        "location_id",
+        "minimum_happiness",
+        "time_of_day",
+    )
+    evo_by_species = {r[i_evolved]: r for r in csvs["pokemon_evolution"][1]}
+
+    # depth below the chain root; walk up to the first known ancestor, then fill the path back down
+    species_depth: dict[str, int] = {}
+    for sid_text in species_chain:
+        path: list[str] = []
+        node = sid_text
+        while node not in species_depth:
+            parent = species_parent.get(node, "")
+            if not parent or species_chain.get(parent, 0) != species_chain[node]:
+                species_depth[node] = 0
+                break
+            path.append(node)
+            node = parent
+        depth = species_depth[node]
+        for child in reversed(path):
+            depth += 1
+            species_depth[child] = depth
+
+    # (id, identifier, display name, is_default, is_mega, is_gmax, sort_order) per species, from the rows
+    # inserted above instead of reading them back; pid order matches the table's rowid order
+    pokemon_rows_by_species: dict[int, list[tuple[int, str, str, int, int, int, int]]] = defaultdict(list)
     default_pokemon_by_species: dict[int, int] = {}
-    con.row_factory = sqlite3.Row
-    all_p_rows = con.execute("SELECT p.*, f.is_default, f.is_mega, f.is_gmax, f.form_order, f.sort_order FROM pokemon p LEFT JOIN pokemon_form_meta f ON p.id=f.pokemon_id").fetchall()
-    for row in all_p_rows:
-        pokemon_rows_by_species[row["species_id"]].append(row)
-        if (row["is_default"] or 0) == 1:
-            default_pokemon_by_species[row["species_id"]] = row["id"]
-
-    def evo_condition_text(evo: dict[str, str] | None) -> str:
+    for (pid, identifier, _, display_name, sid, _, _), (_, is_default, is_mega, is_gmax, _, _, sort_order) in sorted(zip(pokemon_rows, form_meta_rows)):
+        pokemon_rows_by_species[sid].append((pid, identifier, display_name, is_default, is_mega, is_gmax, sort_order))
+        if is_default == 1:
+            default_pokemon_by_species[sid] = pid
+
+    def evo_condition_text(evo: tuple[str, ...] | None) -> str:
         if not evo:
             return ""
-        min_level = safe_int(evo.get("minimum_level"), 0)
-        item_id = evo.get("trigger_item_id") or ""
-        held_item_id = evo.get("held_item_id") or ""
-        trigger_id = evo.get("evolution_trigger_id") or ""
-        known_move_type = evo.get("known_move_type_id") or ""
-        known_move = evo.get("known_move_id") or ""
-        location_id = evo.get("location_id") or ""
-        min_happiness = evo.get("minimum_happiness") or ""
-        time_of_day = evo.get("time_of_day") or ""
+        min_level = safe_int(evo[i_min_level], 0)
+        item_id = evo[i_item]
+        held_item_id = evo[i_held_item]
+        trigger_id = evo[i_trigger]
+        known_move_type = evo[i_move_type]
+        known_move = evo[i_move]
+        location_id = evo[i_location]
+        min_happiness = evo[i_happiness]
+        time_of_day = evo[i_time]
 
         if min_level > 0:
             return f"Lv.{min_level}"
@@ -574,14 +777,14 @@ def build_database(path: Path) -> None:
     for chain_id, species_ids in chain_species.items():
         for sid_text in species_ids:
             sid = safe_int(sid_text, 0)
-            depth = species_depth(sid_text, chain_id)
-            for prow in pokemon_rows_by_species.get(sid, []):
+            depth = species_depth[sid_text]
+            for pid, identifier, display_name, is_default, is_mega, is_gmax, sort_order in pokemon_rows_by_species.get(sid, []):
                 is_special = 0
-                if (prow["is_mega"] or 0) == 1 or (prow["is_gmax"] or 0) == 1:
+                if is_mega == 1 or is_gmax == 1:
                     is_special = 1
-                elif (prow["is_default"] or 0) == 0 and prow["identifier"] != species_id_to_identifier.get(str(sid), prow["identifier"]):
+                elif is_default == 0 and identifier != species_id_to_identifier.get(str(sid), identifier):
                     is_special = 1
-                evo_rows.append((chain_id, depth, prow["id"], prow["display_name_ko"], is_special, prow["sort_order"] or 99999))
+                evo_rows.append((chain_id, depth, pid, display_name, is_special, sort_order or 99999))
 
         # base species evolution edges
         for sid_text in species_ids:
@@ -596,7 +799,7 @@ def build_database(path: Path) -> None:
                 continue
             evo = evo_by_species.get(sid_text)
             cond = evo_condition_text(evo)
-            sort_order = (species_depth(sid_text, chain_id) * 10000) + to_pid
+            sort_order = (species_depth[sid_text] * 10000) + to_pid
             edge_rows.append((chain_id, from_pid, to_pid, cond, sort_order))
 
         # special-form edges (mega/gmax/etc)
@@ -605,48 +808,164 @@ def build_database(path: Path) -> None:
             base_pid = default_pokemon_by_species.get(sid)
             if not base_pid:
                 continue
-            for prow in pokemon_rows_by_species.get(sid, []):
-                if prow["id"] == base_pid:
+            for pid, _, _, _, is_mega, is_gmax, sort_order in pokemon_rows_by_species.get(sid, []):
+                if pid == base_pid:
                     continue
                 cond = "폼변화"
-                if (prow["is_mega"] or 0) == 1:
+                if is_mega == 1:
                     cond = "메가진화"
-                elif (prow["is_gmax"] or 0) == 1:
+                elif is_gmax == 1:
                     cond = "거다이맥스"
-                edge_rows.append((chain_id, base_pid, prow["id"], cond, (species_depth(sid_text, chain_id) * 10000) + (prow["sort_order"] or 99999)))
+                edge_rows.append((chain_id, base_pid, pid, cond, (species_depth[sid_text] * 10000) + (sort_order or 99999)))
 
     cur.executemany("INSERT INTO evolution_member VALUES(?,?,?,?,?,?)", evo_rows)
     cur.executemany("INSERT INTO evolution_edge VALUES(?,?,?,?,?)", edge_rows)
 
+    # indexes are built once over the loaded rows instead of being maintained per insert
+    # (columns follow each detail query's WHERE + ORDER BY so lookups need no sort step)
+    cur.executescript(
+        """
+        CREATE INDEX idx_ability_pokemon ON pokemon_ability(pokemon_id, is_hidden, ability_id);
+        CREATE INDEX idx_type_pokemon ON pokemon_type(pokemon_id, slot);
+        CREATE INDEX idx_egg_move_pokemon ON pokemon_egg_move(pokemon_id, move_name_ko);
+        CREATE INDEX idx_level_move_pokemon ON pokemon_level_move(pokemon_id, learn_level, move_name_ko);
+        CREATE INDEX idx_evolution_member_chain ON evolution_member(chain_id, depth, is_special, sort_order, pokemon_id);
+        CREATE INDEX idx_evolution_edge_chain ON evolution_edge(chain_id, sort_order, from_pokemon_id, to_pokemon_id);
+        """
+    )
+
+    # external-content full-text index over the names used by /api/search
+    try:
+        cur.execute(
+            """
+            CREATE VIRTUAL TABLE pokemon_fts USING fts5(
+                korean_name, display_name_ko, identifier,
+                content='pokemon', content_rowid='id', tokenize='unicode61'
+            )
+            """
+        )
+    except sqlite3.OperationalError:
+        # SQLite built without FTS5: NOCASE name indexes let the LIKE prefix search use index range scans
+        cur.executescript(
+            """
+            CREATE INDEX idx_pokemon_korean_name ON pokemon(korean_name COLLATE NOCASE);
+            CREATE INDEX idx_pokemon_display_name ON pokemon(display_name_ko COLLATE NOCASE);
+            """
+        )
+    else:
+        cur.execute(
+            """
+            INSERT INTO pokemon_fts(rowid, korean_name, display_name_ko, identifier)
+            SELECT id, korean_name, display_name_ko, identifier FROM pokemon
+            """
+        )
+
+    # every detail body is a pure function of the tables above, so render each one once here
+    con.create_function("localize_text", 1, localize_runtime_text, deterministic=True)
+    load_type_chart(con)
+    # (the gzip encoding is stored alongside so serving never compresses)
+    def pokemon_json_rows():
+        for (pid,) in con.execute("SELECT id FROM pokemon").fetchall():
+            body = pokemon_detail(con, pid)
+            yield pid, body, gzip.compress(body, 9)
+
+    cur.execute("CREATE TABLE pokemon_json (id INTEGER PRIMARY KEY, body BLOB NOT NULL, body_gz BLOB NOT NULL)")
+    cur.executemany("INSERT INTO pokemon_json VALUES(?,?,?)", pokemon_json_rows())
+
+    cur.execute("ANALYZE")
     cur.execute(f"PRAGMA user_version={DB_SCHEMA_VERSION}")
     con.commit()
+    # checkpoints were held off during the load; fold the WAL back in once
+    cur.execute("PRAGMA wal_autocheckpoint=1000")
+    cur.execute("PRAGMA wal_checkpoint(TRUNCATE)")
     con.close()
 
 
-def get_connection() -> sqlite3.Connection:
-    con = sqlite3.connect(DB_PATH)
-    con.row_factory = sqlite3.Row
+# The search queries are module constants so each read connection's statement cache reuses the prepared statement.
+SEARCH_SQL = """
+SELECT p.id, p.korean_name, p.display_name_ko, p.identifier, NOT p.is_post_oras
+FROM pokemon_fts
+JOIN pokemon p ON p.id = pokemon_fts.rowid
+WHERE pokemon_fts MATCH ?
+ORDER BY bm25(pokemon_fts), p.korean_name, p.id
+LIMIT 40
+"""
+# used instead when the database has no pokemon_fts: the LIKE prefix search from before FTS
+SEARCH_PREFIX_SQL = """
+SELECT id, korean_name, display_name_ko, identifier, NOT is_post_oras
+FROM pokemon
+WHERE korean_name LIKE :pattern OR display_name_ko LIKE :pattern
+ORDER BY korean_name, id
+LIMIT 40
+"""
+
+
+SEARCH_USES_FTS = True  # set by detect_search_index
+
+
+def detect_search_index() -> None:
+    global SEARCH_USES_FTS
+    with borrow_connection() as con:
+        SEARCH_USES_FTS = con.execute("SELECT 1 FROM sqlite_master WHERE name = 'pokemon_fts'").fetchone() is not None
+
+
+def fts_prefix_query(q: str) -> str:
+    # Quote the input as one FTS5 phrase so operators in it are taken literally, then prefix-match it.
+    return '"' + q.replace('"', '""') + '"*'
+
+
+# Idle read-only connections, shared by all worker threads; at most one per HTTP worker is kept.
+READ_CONNECTIONS: queue.Queue[sqlite3.Connection] = queue.Queue(maxsize=HTTP_THREADS)
+
+
+def open_read_connection() -> sqlite3.Connection:
+    con = sqlite3.connect(f"{DB_PATH.resolve().as_uri()}?mode=ro", uri=True, check_same_thread=False, cached_statements=256)
+    con.executescript("PRAGMA query_only=ON; PRAGMA mmap_size=268435456; PRAGMA cache_size=-65536;")
     return con
 
 
-def type_matchups(con: sqlite3.Connection, type_ids: list[int]) -> dict[str, list[dict[str, str | float]]]:
-    rows = con.execute("SELECT DISTINCT type_id, type_name_ko FROM pokemon_type").fetchall()
-    names = {int(r["type_id"]): r["type_name_ko"] for r in rows}
-    multipliers: dict[int, float] = {tid: 1.0 for tid in names}
+@contextlib.contextmanager
+def borrow_connection() -> Iterator[sqlite3.Connection]:
+    try:
+        con = READ_CONNECTIONS.get_nowait()
+    except queue.Empty:
+        con = open_read_connection()
+    try:
+        yield con
+    finally:
+        try:
+            READ_CONNECTIONS.put_nowait(con)
+        except queue.Full:
+            con.close()
+
+
+# The type chart and DETAIL_SQL below are only used while build_database renders pokemon_json.
+TYPE_NAMES_SQL = "SELECT DISTINCT type_id, type_name_ko FROM pokemon_type"
+TYPE_CHART_SQL = "SELECT attack_type_id, target_type_id, damage_factor FROM type_efficacy"
+
+# type id -> Korean name, and defending type id -> [(attacking type id, damage factor)]; loaded once by load_type_chart.
+TYPE_NAMES: dict[int, str] = {}
+TYPE_FACTORS: dict[int, list[tuple[int, int]]] = defaultdict(list)
+
 
-    for atk in names:
-        m = 1.0
-        for defending in type_ids:
-            row = con.execute(
-                "SELECT damage_factor FROM type_efficacy WHERE attack_type_id=? AND target_type_id=?",
-                (atk, defending),
-            ).fetchone()
-            if row:
-                m *= row["damage_factor"] / 100
-        multipliers[atk] = m
+def load_type_chart(con: sqlite3.Connection) -> None:
+    TYPE_NAMES.clear()
+    TYPE_FACTORS.clear()
+    type_matchups_json.cache_clear()
+    TYPE_NAMES.update((int(tid), name) for tid, name in con.execute(TYPE_NAMES_SQL))
+    for attack_type_id, target_type_id, damage_factor in con.execute(TYPE_CHART_SQL):
+        TYPE_FACTORS[target_type_id].append((attack_type_id, damage_factor))
+
+
+def type_matchups(type_ids: tuple[int, ...]) -> dict[str, list[dict[str, str | float]]]:
+    multipliers: dict[int, float] = {tid: 1.0 for tid in TYPE_NAMES}
+    for target_type_id in type_ids:
+        for attack_type_id, damage_factor in TYPE_FACTORS.get(target_type_id, ()):
+            if attack_type_id in multipliers:
+                multipliers[attack_type_id] *= damage_factor / 100
 
     def collect(pred: callable) -> list[dict[str, str | float]]:
-        out = [{"type": names[t], "multiplier": m} for t, m in multipliers.items() if pred(m)]
+        out = [{"type": TYPE_NAMES[t], "multiplier": m} for t, m in multipliers.items() if pred(m)]
         return sorted(out, key=lambda x: (x["multiplier"], x["type"]))
 
     return {
@@ -656,229 +975,361 @@ def type_matchups(con: sqlite3.Connection, type_ids: list[int]) -> dict[str, lis
     }
 
 
-def ordered_stats(rows: list[sqlite3.Row]) -> tuple[list[dict[str, int | str]], int]:
-    raw = {r["stat_identifier"]: int(r["base_stat"]) for r in rows}
-    ordered = [{"key": key, "name": STAT_LABELS[key], "value": raw.get(key, 0)} for key in STAT_ORDER]
-    total = sum(item["value"] for item in ordered)
-    return ordered, total
+# Only a few hundred typings exist and many pokemon share one; key is the sorted, de-duplicated type ids.
+@functools.lru_cache(maxsize=512)
+def type_matchups_json(type_ids: tuple[int, ...]) -> bytes:
+    return dumps_json(type_matchups(type_ids))
 
 
 
 
+# Move and ability descriptions repeat across many pokemon, so each distinct text is localized once.
+@functools.lru_cache(maxsize=16384)
 def localize_runtime_text(text: str | None) -> str:
     if not text:
         return "공식 한글 설명이 없습니다."
     t = clean_effect_text(text)
-    if re.search(r"[A-Za-z]", t):
+    if RE_LATIN.search(t):
         translated = translate_en_to_ko(t)
-        if re.search(r"[A-Za-z]", translated):
+        if RE_LATIN.search(translated):
             return "공식 한글 설명이 없습니다."
         return translated
     return t
 
-class Handler(BaseHTTPRequestHandler):
-    def _send(self, body: bytes, code: int = 200, ctype: str = "text/html; charset=utf-8") -> None:
-        self.send_response(code)
-        self.send_header("Content-Type", ctype)
-        self.send_header("Content-Length", str(len(body)))
-        self.end_headers()
-        self.wfile.write(body)
+# One statement renders every list of the detail page (once per pokemon, at build time); SQLite builds the JSON arrays itself.
+DETAIL_SQL = """
+SELECT
+    p.id, p.korean_name, p.display_name_ko, p.identifier, p.is_post_oras,
+    (
+        SELECT json_group_array(json_object('key', key, 'name', name, 'value', value))
+        FROM (
+            SELECT json_extract(o.value, '$[0]') AS key, json_extract(o.value, '$[1]') AS name, coalesce(s.base_stat, 0) AS value
+            FROM json_each(:stat_layout) o
+            LEFT JOIN pokemon_stat s ON s.pokemon_id = p.id AND s.stat_identifier = json_extract(o.value, '$[0]')
+            ORDER BY o.key
+        )
+    ) AS stats,
+    (
+        SELECT coalesce(sum(base_stat), 0) FROM pokemon_stat
+        WHERE pokemon_id = p.id AND stat_identifier IN (SELECT json_extract(value, '$[0]') FROM json_each(:stat_layout))
+    ) AS stat_total,
+    (SELECT group_concat(type_id) FROM (SELECT type_id FROM pokemon_type WHERE pokemon_id = p.id ORDER BY slot)) AS type_ids,
+    (SELECT json_group_array(type_name_ko) FROM (SELECT type_name_ko FROM pokemon_type WHERE pokemon_id = p.id ORDER BY slot)) AS types,
+    (
+        SELECT json_group_array(json_object(
+            'name', ability_name_ko,
+            'description', localize_text(ability_effect_ko),
+            'hidden', json(CASE WHEN is_hidden THEN 'true' ELSE 'false' END),
+            'post_oras', json(CASE WHEN is_post_oras THEN 'true' ELSE 'false' END)
+        ))
+        FROM (SELECT * FROM pokemon_ability WHERE pokemon_id = p.id ORDER BY is_hidden, ability_id)
+    ) AS abilities,
+    (
+        SELECT json_group_array(json_object(
+            'name', move_name_ko,
+            'type', type_name_ko,
+            'damage_class', damage_class_ko,
+            'power', power,
+            'accuracy', accuracy,
+            'pp', pp,
+            'effect', localize_text(effect_text_ko),
+            'level', learn_level,
+            'post_oras', json(CASE WHEN is_post_oras THEN 'true' ELSE 'false' END)
+        ))
+        FROM (SELECT * FROM pokemon_level_move WHERE pokemon_id = p.id ORDER BY learn_level, move_name_ko)
+    ) AS level_moves,
+    (
+        SELECT json_group_array(json_object(
+            'name', move_name_ko,
+            'type', type_name_ko,
+            'damage_class', damage_class_ko,
+            'power', power,
+            'accuracy', accuracy,
+            'pp', pp,
+            'effect', localize_text(effect_text_ko),
+            'post_oras', json(CASE WHEN is_post_oras THEN 'true' ELSE 'false' END)
+        ))
+        FROM (SELECT * FROM pokemon_egg_move WHERE pokemon_id = p.id ORDER BY move_name_ko)
+    ) AS egg_moves,
+    (
+        SELECT json_group_array(json_object(
+            'depth', depth,
+            'pokemon_id', pokemon_id,
+            'name', display_name_ko,
+            'is_special', json(CASE WHEN is_special THEN 'true' ELSE 'false' END)
+        ))
+        FROM (SELECT * FROM evolution_member WHERE chain_id = p.evolution_chain_id ORDER BY depth, is_special, sort_order, pokemon_id)
+    ) AS evolution_tree,
+    (
+        SELECT json_group_array(json_object(
+            'from', from_pokemon_id,
+            'to', to_pokemon_id,
+            'condition', coalesce(nullif(condition_text, ''), '진화')
+        ))
+        FROM (SELECT * FROM evolution_edge WHERE chain_id = p.evolution_chain_id ORDER BY sort_order, from_pokemon_id, to_pokemon_id)
+    ) AS evolution_edges
+FROM pokemon p
+WHERE p.id = :pid
+"""
+
+
+def json_object_bytes(fields: dict[str, bytes]) -> bytes:
+    # Splice already-encoded JSON values into one object without decoding them again.
+    return b"{" + b",".join(dumps_json(key) + b":" + value for key, value in fields.items()) + b"}"
+
+
+def pokemon_detail(con: sqlite3.Connection, pid: int) -> bytes | None:
+    row = con.execute(DETAIL_SQL, {"pid": pid, "stat_layout": STAT_LAYOUT_JSON}).fetchone()
+    if row is None:
+        return None
+    (
+        pid, korean_name, display_name, identifier, is_post_oras,
+        stats, stat_total, type_id_text, types, abilities, level_moves, egg_moves, evolution_tree, evolution_edges,
+    ) = row
+
+    type_ids = [int(t) for t in (type_id_text or "").split(",") if t]
+    return json_object_bytes(
+        {
+            "id": dumps_json(pid),
+            "korean_name": dumps_json(korean_name),
+            "display_name": dumps_json(display_name),
+            "identifier": dumps_json(identifier),
+            "oras_available": dumps_json(not bool(is_post_oras)),
+            "image": ARTWORK_URL_JSON % pid,
+            "types": types.encode("utf-8"),
+            "stats": stats.encode("utf-8"),
+            "stat_total": dumps_json(stat_total),
+            "abilities": abilities.encode("utf-8"),
+            "type_matchups": type_matchups_json(tuple(sorted(set(type_ids)))),
+            "level_moves": level_moves.encode("utf-8"),
+            "egg_moves": egg_moves.encode("utf-8"),
+            "evolution_tree": evolution_tree.encode("utf-8"),
+            "evolution_edges": evolution_edges.encode("utf-8"),
+        }
+    )
 
-    def do_GET(self) -> None:  # noqa: N802
-        parsed = urllib.parse.urlparse(self.path)
-        path = parsed.path
 
-        if path == "/":
-            self._send(INDEX_HTML.encode("utf-8"))
-            return
-        if path == "/static/style.css":
-            self._send(STYLE_CSS.encode("utf-8"), ctype="text/css; charset=utf-8")
+# pid -> (body, gzip body); both are rendered into pokemon_json at build time and only loaded here.
+DETAIL_CACHE: dict[int, tuple[bytes, bytes]] = {}
+
+
+def warm_detail_cache() -> None:
+    with borrow_connection() as con:
+        for pid, body, body_gz in con.execute("SELECT id, body, body_gz FROM pokemon_json"):
+            DETAIL_CACHE[pid] = (body, body_gz)
+
+
+def accepts_gzip(accept_encoding: str | None) -> bool:
+    # An explicit gzip entry decides; otherwise "*" covers it. q=0 means "not acceptable".
+    if not accept_encoding:
+        return False
+    wildcard = False
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding in ("gzip", "x-gzip"):
+            return q > 0
+        if coding == "*":
+            wildcard = q > 0
+    return wildcard
+
+
+def query_param(query: str, name: str) -> str:
+    # First non-empty value of one parameter, decoded like parse_qs; only the key the route needs is decoded.
+    prefix = name + "="
+    for part in query.split("&"):
+        if part.startswith(prefix) and len(part) > len(prefix):
+            return urllib.parse.unquote_plus(part[len(prefix):])
+    return ""
+
+
+def detail_etag(pid: int) -> str:
+    # Detail data only changes when the database file is rebuilt, so (pid, db mtime) identifies a body.
+    return f'W/"{pid}-{DB_MTIME}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    etag = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") in (etag, "*") for tag in if_none_match.split(","))
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # reading a started request and sending a response may take this long
+    timeout = 30
+    # waiting for the next request on a keep-alive connection gives the worker back after this many seconds
+    idle_timeout = 2
+    disable_nagle_algorithm = True
+    wbufsize = 64 * 1024
+
+    def log_request(self, code: int | str = "-", size: int | str = "-") -> None:
+        # Per-request access lines cost a formatted stderr write each; errors are still logged.
+        if ACCESS_LOG:
+            super().log_request(code, size)
+
+    def handle_one_request(self) -> None:
+        # Wait for the first byte of the next request under the short idle timeout; an idle client
+        # is closed quietly instead of logging "Request timed out".
+        self.connection.settimeout(self.idle_timeout)
+        try:
+            self.rfile.peek(1)
+        except TimeoutError:
+            self.close_connection = True
             return
-        if path == "/static/app.js":
-            self._send(APP_JS.encode("utf-8"), ctype="application/javascript; charset=utf-8")
+        self.connection.settimeout(self.timeout)
+        super().handle_one_request()
+
+    def _write_response(self, code: int, headers: dict[str, str], body: bytes = b"") -> None:
+        # Status line, headers and body leave in one write instead of one per header.
+        self.log_request(code)
+        if not self.server.keep_alive_allowed():
+            headers = {**headers, "Connection": "close"}
+            self.close_connection = True
+        head = [
+            f"{self.protocol_version} {code} {self.responses[code][0]}",
+            f"Server: {self.version_string()}",
+            f"Date: {self.date_time_string()}",
+        ]
+        head.extend(f"{key}: {value}" for key, value in headers.items())
+        self.wfile.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body)
+
+    def _send(self, body: bytes, code: int = 200, ctype: str = "text/html; charset=utf-8", headers: dict[str, str] | None = None) -> None:
+        self._write_response(code, {"Content-Type": ctype, "Content-Length": str(len(body)), **(headers or {})}, body)
+
+    def _send_compressible(self, raw: bytes, gz: bytes, ctype: str, headers: dict[str, str]) -> None:
+        # Pick the pre-compressed body when the client accepts gzip.
+        headers = {**headers, "Vary": "Accept-Encoding"}
+        if accepts_gzip(self.headers.get("Accept-Encoding")):
+            headers["Content-Encoding"] = "gzip"
+            raw = gz
+        self._send(raw, ctype=ctype, headers=headers)
+
+    def _send_not_modified(self, headers: dict[str, str]) -> None:
+        self._write_response(304, headers)
+
+    def do_GET(self) -> None:  # noqa: N802
+        path, _, query = self.path.partition("?")
+
+        asset = STATIC_ASSETS.get(path)
+        if asset is not None:
+            raw, gz, ctype, etag = asset
+            headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+            if etag_matches(self.headers.get("If-None-Match"), etag):
+                self._send_not_modified(headers)
+                return
+            self._send_compressible(raw, gz, ctype, headers)
             return
         if path == "/api/search":
-            q = urllib.parse.parse_qs(parsed.query).get("q", [""])[0].strip()
+            q = query_param(query, "q").strip()
             if not q:
                 self._send(b"[]", ctype="application/json; charset=utf-8")
                 return
-            con = get_connection()
-            rows = con.execute(
-                """
-                SELECT id, korean_name, display_name_ko, identifier, is_post_oras
-                FROM pokemon
-                WHERE korean_name LIKE ? OR display_name_ko LIKE ?
-                ORDER BY korean_name, id
-                LIMIT 40
-                """,
-                (f"{q}%", f"{q}%"),
-            ).fetchall()
-            con.close()
+            with borrow_connection() as con:
+                if SEARCH_USES_FTS:
+                    rows = con.execute(SEARCH_SQL, (fts_prefix_query(q),)).fetchall()
+                else:
+                    rows = con.execute(SEARCH_PREFIX_SQL, {"pattern": f"{q}%"}).fetchall()
+            # rows unpack in the column order of SEARCH_SQL / SEARCH_PREFIX_SQL
             out = [
-                {
-                    "id": r["id"],
-                    "korean_name": r["korean_name"],
-                    "display_name": r["display_name_ko"],
-                    "identifier": r["identifier"],
-                    "oras_available": not bool(r["is_post_oras"]),
-                }
-                for r in rows
+                {"id": pid, "korean_name": korean_name, "display_name": display_name, "identifier": identifier, "oras_available": bool(available)}
+                for pid, korean_name, display_name, identifier, available in rows
             ]
-            self._send(json.dumps(out, ensure_ascii=False).encode("utf-8"), ctype="application/json; charset=utf-8")
+            self._send(dumps_json(out), ctype="application/json; charset=utf-8")
             return
 
         if path.startswith("/api/pokemon/"):
-            pid_text = path.replace("/api/pokemon/", "")
+            pid_text = path[len("/api/pokemon/"):]
             if not pid_text.isdigit():
-                self._send(b'{"error":"invalid id"}', code=400, ctype="application/json; charset=utf-8")
+                self._send(ERROR_INVALID_ID, code=400, ctype="application/json; charset=utf-8")
                 return
             pid = int(pid_text)
 
-            con = get_connection()
-            p = con.execute("SELECT * FROM pokemon WHERE id=?", (pid,)).fetchone()
-            if p is None:
-                con.close()
-                self._send(b'{"error":"not found"}', code=404, ctype="application/json; charset=utf-8")
+            cached = DETAIL_CACHE.get(pid)
+            if cached is None:
+                self._send(ERROR_NOT_FOUND, code=404, ctype="application/json; charset=utf-8")
                 return
-
-            stat_rows = con.execute("SELECT stat_identifier, base_stat FROM pokemon_stat WHERE pokemon_id=?", (pid,)).fetchall()
-            stats, stat_total = ordered_stats(stat_rows)
-            abilities = con.execute(
-                """
-                SELECT ability_name_ko, ability_effect_ko, is_post_oras, is_hidden
-                FROM pokemon_ability
-                WHERE pokemon_id=?
-                ORDER BY is_hidden, ability_id
-                """,
-                (pid,),
-            ).fetchall()
-            types = con.execute("SELECT type_id, type_name_ko FROM pokemon_type WHERE pokemon_id=? ORDER BY slot", (pid,)).fetchall()
-            egg_moves = con.execute(
-                """
-                SELECT move_name_ko, type_name_ko, damage_class_ko, power, accuracy, pp, effect_text_ko, is_post_oras
-                FROM pokemon_egg_move
-                WHERE pokemon_id=?
-                ORDER BY move_name_ko
-                """,
-                (pid,),
-            ).fetchall()
-            level_moves = con.execute(
-                """
-                SELECT move_name_ko, type_name_ko, damage_class_ko, power, accuracy, pp, effect_text_ko, learn_level, is_post_oras
-                FROM pokemon_level_move
-                WHERE pokemon_id=?
-                ORDER BY learn_level, move_name_ko
-                """,
-                (pid,),
-            ).fetchall()
-            evolution_rows = con.execute(
-                """
-                SELECT depth, pokemon_id, display_name_ko, is_special
-                FROM evolution_member
-                WHERE chain_id=?
-                ORDER BY depth, is_special, sort_order, pokemon_id
-                """,
-                (p["evolution_chain_id"],),
-            ).fetchall()
-            evolution_edges = con.execute(
-                """
-                SELECT from_pokemon_id, to_pokemon_id, condition_text
-                FROM evolution_edge
-                WHERE chain_id=?
-                ORDER BY sort_order, from_pokemon_id, to_pokemon_id
-                """,
-                (p["evolution_chain_id"],),
-            ).fetchall()
-
-            payload = {
-                "id": p["id"],
-                "korean_name": p["korean_name"],
-                "display_name": p["display_name_ko"],
-                "identifier": p["identifier"],
-                "oras_available": not bool(p["is_post_oras"]),
-                "image": f"https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/{p['id']}.png",
-                "types": [r["type_name_ko"] for r in types],
-                "stats": stats,
-                "stat_total": stat_total,
-                "abilities": [
-                    {
-                        "name": r["ability_name_ko"],
-                        "description": localize_runtime_text(r["ability_effect_ko"]),
-                        "hidden": bool(r["is_hidden"]),
-                        "post_oras": bool(r["is_post_oras"]),
-                    }
-                    for r in abilities
-                ],
-                "type_matchups": type_matchups(con, [int(r["type_id"]) for r in types]),
-                "level_moves": [
-                    {
-                        "name": r["move_name_ko"],
-                        "type": r["type_name_ko"],
-                        "damage_class": r["damage_class_ko"],
-                        "power": r["power"],
-                        "accuracy": r["accuracy"],
-                        "pp": r["pp"],
-                        "effect": localize_runtime_text(r["effect_text_ko"]),
-                        "level": r["learn_level"],
-                        "post_oras": bool(r["is_post_oras"]),
-                    }
-                    for r in level_moves
-                ],
-                "egg_moves": [
-                    {
-                        "name": r["move_name_ko"],
-                        "type": r["type_name_ko"],
-                        "damage_class": r["damage_class_ko"],
-                        "power": r["power"],
-                        "accuracy": r["accuracy"],
-                        "pp": r["pp"],
-                        "effect": localize_runtime_text(r["effect_text_ko"]),
-                        "post_oras": bool(r["is_post_oras"]),
-                    }
-                    for r in egg_moves
-                ],
-                "evolution_tree": [
-                    {
-                        "depth": r["depth"],
-                        "pokemon_id": r["pokemon_id"],
-                        "name": r["display_name_ko"],
-                        "image": f"https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork/{r['pokemon_id']}.png",
-                        "is_special": bool(r["is_special"]),
-                    }
-                    for r in evolution_rows
-                ],
-                "evolution_edges": [
-                    {
-                        "from": r["from_pokemon_id"],
-                        "to": r["to_pokemon_id"],
-                        "condition": r["condition_text"] or "진화",
-                    }
-                    for r in evolution_edges
-                ],
-            }
-            con.close()
-            self._send(json.dumps(payload, ensure_ascii=False).encode("utf-8"), ctype="application/json; charset=utf-8")
+            etag = detail_etag(pid)
+            if etag_matches(self.headers.get("If-None-Match"), etag):
+                self._send_not_modified({"ETag": etag, "Cache-Control": CACHE_CONTROL})
+                return
+            self._send_compressible(*cached, "application/json; charset=utf-8", {"ETag": etag, "Cache-Control": CACHE_CONTROL})
             return
 
         self._send(b"Not found", 404, "text/plain; charset=utf-8")
 
 
+class PooledHTTPServer(ThreadingHTTPServer):
+    # Connections are handed to a fixed set of reusable worker threads instead of one new thread each.
+    # A deeper listen backlog lets connection bursts wait in the kernel rather than being refused.
+    request_queue_size = 128
+
+    def __init__(self, server_address: tuple[str, int], handler_class: type[BaseHTTPRequestHandler], max_workers: int = HTTP_THREADS) -> None:
+        super().__init__(server_address, handler_class)
+        self.max_workers = max_workers
+        self.pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="http")
+        # sockets handed to the pool and not yet finished, whether running or still queued
+        self.connections: set[socket.socket] = set()
+        self.connections_lock = threading.Lock()
+
+    def process_request(self, request, client_address) -> None:  # noqa: ANN001
+        with self.connections_lock:
+            self.connections.add(request)
+        self.pool.submit(self.process_connection, request, client_address)
+
+    def process_connection(self, request, client_address) -> None:  # noqa: ANN001
+        try:
+            self.process_request_thread(request, client_address)
+        finally:
+            with self.connections_lock:
+                self.connections.discard(request)
+
+    def keep_alive_allowed(self) -> bool:
+        # An idle keep-alive connection parks a worker until it times out, so once every worker holds
+        # a connection, responses close theirs and a worker stays free for new clients.
+        return len(self.connections) < self.max_workers
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.pool.shutdown(wait=False, cancel_futures=True)
+        # wake workers blocked reading idle keep-alive connections so interpreter exit does not wait on them
+        with self.connections_lock:
+            connections = list(self.connections)
+        for request in connections:
+            try:
+                request.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+
 def launch_edge(url: str) -> None:
     if not sys.platform.startswith("win"):
         return
     try:
-        subprocess.Popen(["cmd", "/c", "start", "msedge", url], shell=False)
+        # the microsoft-edge: protocol keeps opening Edge, without spawning cmd.exe just to run "start"
+        os.startfile(f"microsoft-edge:{url}")
     except Exception:
         pass
 
 
 def run() -> None:
     ensure_db()
+    detect_search_index()
+    warm_detail_cache()
     url = f"http://127.0.0.1:{PORT}"
     threading.Timer(1.0, lambda: launch_edge(url)).start()
-    server = ThreadingHTTPServer((HOST, PORT), Handler)
-    print(f"Pokemon Wiki running at {url}")
-    server.serve_forever()
+    with PooledHTTPServer((HOST, PORT), Handler) as server:
+        print(f"Pokemon Wiki running at {url}")
+        server.serve_forever()
 
 
 if __name__ == "__main__":
@@ -8,6 +8,10 @@ const TYPE_COLORS = {
   바위: '#B6A136', 고스트: '#735797', 드래곤: '#6F35FC', 악: '#705746', 강철: '#B7B7CE', 페어리: '#D685AD'
 };
 
+// evolution nodes only carry pokemon_id; the artwork URL is built here
+const ARTWORK_BASE = 'https://raw.githubusercontent.com/PokeAPI/sprites/master/sprites/pokemon/other/official-artwork';
+const artworkUrl = (id) => `${ARTWORK_BASE}/${id}.png`;
+
 const statColor = {
   hp: '#ff5959', attack: '#f59e0b', defense: '#3b82f6', 'special-attack': '#8b5cf6', 'special-defense': '#14b8a6', speed: '#10b981'
 };
@@ -76,7 +80,7 @@ function renderEvolutionTree(tree, edges) {
   if (!validEdges.length) {
     return `<div class="evo-chain-row">${tree.map((n) => `
       <button class="evo-node${n.is_special ? ' special' : ''}" data-id="${n.pokemon_id}">
-        <img src="${n.image}" alt="${n.name}" />
+        <img src="${artworkUrl(n.pokemon_id)}" alt="${n.name}" />
         <div>${n.name}</div>
       </button>`).join('')}</div>`;
   }
@@ -118,7 +122,7 @@ function renderEvolutionTree(tree, edges) {
       const n = nodeMap.get(nid);
       html += `
         <button class="evo-node${n.is_special ? ' special' : ''}" data-id="${n.pokemon_id}">
-          <img src="${n.image}" alt="${n.name}" />
+          <img src="${artworkUrl(n.pokemon_id)}" alt="${n.name}" />
           <div>${n.name}</div>
         </button>
       `;